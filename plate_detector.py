@@ -36,11 +36,156 @@ def preprocess_crop(crop):
     return cv2.cvtColor(thresh, cv2.COLOR_GRAY2BGR)
 
 
+def filter_detections(raw_boxes, conf=0.7, nms_iou=0.3):
+    boxes, detections = [], []
+    for box in raw_boxes:
+        x1, y1, x2, y2, score, class_id = box
+        if score < conf:
+            continue
+        boxes.append([x1, y1, x2, y2, score])
+        detections.append(([x1, y1, x2 - x1, y2 - y1], score, "plate"))
+
+    keep, used = [], [False] * len(boxes)
+    for i in range(len(boxes)):
+        if used[i]:
+            continue
+        keep.append(i)
+        for j in range(i + 1, len(boxes)):
+            if used[j]:
+                continue
+            if iou(boxes[i][:4], boxes[j][:4]) > nms_iou:
+                used[j] = True
+    return [detections[i] for i in keep]
+
+
+def predicted_boxes(tracker, max_misses=5):
+    # Box tiap track yang digeser satu langkah dengan kecepatan Kalman,
+    # yaitu perkiraan posisi plat di frame berikutnya
+    boxes = []
+    for track in tracker.tracker.tracks:
+        if track.is_deleted() or track.time_since_update > max_misses:
+            continue
+        x1, y1, x2, y2 = track.to_ltrb()
+        vx, vy = track.mean[4], track.mean[5]
+        boxes.append([x1 + vx, y1 + vy, x2 + vx, y2 + vy])
+    return boxes
+
+
+def letterbox_pixels(h, w, imgsz, stride=32):
+    # Perkiraan jumlah piksel input YOLO setelah letterbox (rect inference),
+    # dipakai sebagai proxy FLOPs detektor
+    r = min(imgsz / h, imgsz / w)
+    new_h = int(np.ceil(round(h * r) / stride) * stride)
+    new_w = int(np.ceil(round(w * r) / stride) * stride)
+    return new_h * new_w
+
+
+class DetectionScheduler:
+    """Full-frame scan at reduced resolution every N frames, ROI-only
+    detection around predicted track boxes in between. Returned boxes are
+    always in original frame coordinates."""
+
+    def __init__(
+        self,
+        model,
+        full_scan_interval=10,
+        full_scan_imgsz=320,
+        roi_margin=0.5,
+        roi_max_imgsz=640,
+    ):
+        self.model = model
+        self.full_scan_interval = full_scan_interval
+        self.full_scan_imgsz = full_scan_imgsz
+        self.roi_margin = roi_margin
+        self.roi_max_imgsz = roi_max_imgsz
+        self.frame_index = 0
+        self.stats = {
+            "frames": 0,
+            "full_scans": 0,
+            "roi_runs": 0,
+            "skipped": 0,
+            "detector_time": 0.0,
+            "detector_pixels": 0,
+        }
+
+    def _run(self, image, imgsz):
+        start = time.perf_counter()
+        results = self.model(image, imgsz=imgsz, verbose=False)[0]
+        self.stats["detector_time"] += time.perf_counter() - start
+        h, w = image.shape[:2]
+        self.stats["detector_pixels"] += letterbox_pixels(h, w, imgsz)
+        return results.boxes.data.tolist()
+
+    def _rois(self, frame_shape, boxes):
+        h, w = frame_shape[:2]
+        rois = []
+        for x1, y1, x2, y2 in boxes:
+            mx = (x2 - x1) * self.roi_margin
+            my = (y2 - y1) * self.roi_margin
+            roi = [
+                max(0, int(x1 - mx)),
+                max(0, int(y1 - my)),
+                min(w, int(x2 + mx)),
+                min(h, int(y2 + my)),
+            ]
+            if roi[2] > roi[0] and roi[3] > roi[1]:
+                rois.append(roi)
+
+        # Gabungkan ROI yang saling tumpang tindih supaya plat yang sama
+        # tidak dideteksi dua kali
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(rois)):
+                for j in range(i + 1, len(rois)):
+                    a, b = rois[i], rois[j]
+                    if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                        rois[i] = [
+                            min(a[0], b[0]),
+                            min(a[1], b[1]),
+                            max(a[2], b[2]),
+                            max(a[3], b[3]),
+                        ]
+                        del rois[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+        return rois
+
+    def detect(self, frame, predicted=()):
+        is_full_scan = self.frame_index % self.full_scan_interval == 0
+        self.frame_index += 1
+        self.stats["frames"] += 1
+
+        if is_full_scan:
+            # YOLO me-letterbox frame ke imgsz dan mengembalikan box dalam
+            # koordinat frame asli
+            self.stats["full_scans"] += 1
+            return self._run(frame, self.full_scan_imgsz)
+
+        rois = self._rois(frame.shape, predicted)
+        if not rois:
+            self.stats["skipped"] += 1
+            return []
+
+        boxes = []
+        for rx1, ry1, rx2, ry2 in rois:
+            roi = frame[ry1:ry2, rx1:rx2]
+            longest = max(roi.shape[:2])
+            imgsz = min(self.roi_max_imgsz, int(np.ceil(longest / 32) * 32))
+            self.stats["roi_runs"] += 1
+            for x1, y1, x2, y2, score, class_id in self._run(roi, imgsz):
+                boxes.append([x1 + rx1, y1 + ry1, x2 + rx1, y2 + ry1, score, class_id])
+        return boxes
+
+
 class PlateDetector:
     def __init__(self, camera_index=0):
         self.reader = easyocr.Reader(["id"], gpu=True)
         self.model = YOLO("./models/PlateDetection.pt")
         self.tracker = DeepSort(max_age=30)
+        self.scheduler = DetectionScheduler(self.model)
         self.cap = cv2.VideoCapture(camera_index)
         self.ocr_results = {}
         self.ocr_votes = {}
@@ -78,28 +223,11 @@ class PlateDetector:
         if not ret:
             return None, None, None
 
-        results = self.model(frame)[0]
-        h, w, _ = frame.shape
-        detections, boxes = [], []
-
-        for box in results.boxes.data.tolist():
-            x1, y1, x2, y2, score, class_id = box
-            if score < 0.7:
-                continue
-            boxes.append([x1, y1, x2, y2, score])
-            detections.append(([x1, y1, x2 - x1, y2 - y1], score, "plate"))
-
-        keep, used = [], [False] * len(boxes)
-        for i in range(len(boxes)):
-            if used[i]:
-                continue
-            keep.append(i)
-            for j in range(i + 1, len(boxes)):
-                if used[j]:
-                    continue
-                if iou(boxes[i][:4], boxes[j][:4]) > 0.3:
-                    used[j] = True
-        detections = [detections[i] for i in keep]
+        # Deteksi dijadwalkan: scan penuh resolusi rendah tiap N frame, di
+        # antaranya hanya ROI sekitar prediksi tracker. Crop OCR tetap dari
+        # frame resolusi penuh.
+        raw_boxes = self.scheduler.detect(frame, predicted_boxes(self.tracker))
+        detections = filter_detections(raw_boxes)
 
         tracks = self.tracker.update_tracks(detections, frame=frame)
         detected_plate, registered = None, False
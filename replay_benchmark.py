@@ -0,0 +1,111 @@
+import argparse
+import time
+
+import cv2
+from deep_sort_realtime.deepsort_tracker import DeepSort
+from ultralytics import YOLO
+
+from plate_detector import (
+    DetectionScheduler,
+    filter_detections,
+    iou,
+    letterbox_pixels,
+    predicted_boxes,
+)
+
+
+def match_count(reference, candidates, iou_thresh):
+    used = [False] * len(candidates)
+    matched = 0
+    for ref in reference:
+        for i, cand in enumerate(candidates):
+            if not used[i] and iou(ref, cand) >= iou_thresh:
+                used[i] = True
+                matched += 1
+                break
+    return matched
+
+
+def to_ltrb(detections):
+    return [[x, y, x + w, y + h] for (x, y, w, h), _, _ in detections]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bandingkan deteksi full-frame tiap frame dengan DetectionScheduler"
+    )
+    parser.add_argument("video", help="Video rekaman untuk replay")
+    parser.add_argument("--model", default="./models/PlateDetection.pt")
+    parser.add_argument("--interval", type=int, default=10)
+    parser.add_argument("--full-imgsz", type=int, default=320)
+    parser.add_argument("--baseline-imgsz", type=int, default=640)
+    parser.add_argument("--roi-margin", type=float, default=0.5)
+    parser.add_argument("--iou", type=float, default=0.5)
+    args = parser.parse_args()
+
+    model = YOLO(args.model)
+    scheduler = DetectionScheduler(
+        model,
+        full_scan_interval=args.interval,
+        full_scan_imgsz=args.full_imgsz,
+        roi_margin=args.roi_margin,
+    )
+    tracker = DeepSort(max_age=30)
+    cap = cv2.VideoCapture(args.video)
+
+    baseline_time, baseline_pixels = 0.0, 0
+    reference_total, matched_total = 0, 0
+    warmed_up = False
+
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        h, w = frame.shape[:2]
+        if not warmed_up:
+            model(frame, imgsz=args.baseline_imgsz, verbose=False)
+            warmed_up = True
+
+        # Referensi: perilaku lama, YOLO full-frame di setiap frame
+        start = time.perf_counter()
+        results = model(frame, imgsz=args.baseline_imgsz, verbose=False)[0]
+        baseline_time += time.perf_counter() - start
+        baseline_pixels += letterbox_pixels(h, w, args.baseline_imgsz)
+        reference = to_ltrb(filter_detections(results.boxes.data.tolist()))
+
+        raw_boxes = scheduler.detect(frame, predicted_boxes(tracker))
+        detections = filter_detections(raw_boxes)
+        tracker.update_tracks(detections, frame=frame)
+
+        reference_total += len(reference)
+        matched_total += match_count(reference, to_ltrb(detections), args.iou)
+
+    cap.release()
+
+    stats = scheduler.stats
+    frames = max(stats["frames"], 1)
+    recall = matched_total / reference_total if reference_total else 1.0
+    pixel_ratio = stats["detector_pixels"] / max(baseline_pixels, 1)
+    time_ratio = stats["detector_time"] / max(baseline_time, 1e-9)
+
+    print(f"Frames             : {stats['frames']}")
+    print(f"Full scans         : {stats['full_scans']}")
+    print(f"ROI runs           : {stats['roi_runs']}")
+    print(f"Skipped frames     : {stats['skipped']}")
+    print(
+        f"Detector time      : {baseline_time / frames * 1000:.1f} ms/frame -> "
+        f"{stats['detector_time'] / frames * 1000:.1f} ms/frame "
+        f"({(1 - time_ratio) * 100:.1f}% saved)"
+    )
+    print(
+        f"Detector FLOPs     : {(1 - pixel_ratio) * 100:.1f}% saved "
+        f"(input pixels after letterbox)"
+    )
+    print(
+        f"Plate box recall   : {recall * 100:.1f}% "
+        f"({matched_total}/{reference_total}, IoU >= {args.iou})"
+    )
+
+
+if __name__ == "__main__":
+    main()